@@ -4,6 +4,9 @@ from PyQt6.QtGui import QColor, QBrush
 import re
 import os
 
+# Set True to log every added row (slow during imports)
+_DEBUG = False
+
 class TableController(QObject):
     data_added = pyqtSignal()
     data_removed = pyqtSignal()
@@ -104,7 +107,8 @@ class TableController(QObject):
         # Emit data added signal
         self.data_added.emit()
         
-        print(f"Added row with websign: {websign}, total rows: {model.get_total_rows()}")
+        if _DEBUG:
+            print(f"Added row with websign: {websign}, total rows: {model.get_total_rows()}")
 
     def _perform_delayed_rebuild(self):
         """
@@ -2,12 +2,15 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                            QLineEdit, QPushButton, QMessageBox, QFileDialog, 
                            QProgressDialog, QTableWidgetItem)
 from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtGui import QImage
 import requests
 from bs4 import BeautifulSoup
 import webbrowser
 import os
+from collections import OrderedDict
 from utils.user_agents import get_random_user_agent
-from utils.helpers import fetch_zip_numbers_from_directory, save_numbers_to_file
+from utils.helpers import (fetch_zip_numbers_from_directory, save_numbers_to_file, cover_cache_path,
+                           touch_cached_cover, save_cached_cover)
 
 class WebController:
     def __init__(self, main_window):
@@ -18,9 +21,15 @@ class WebController:
         self.dist_website_value = self.config_manager.get_dist_website()
         self.lib_path_value = self.config_manager.get_lib_path()
 
-        # Cover image cache
-        self.cover_cache = {}
+        # Cover image cache (LRU: most recently used at the end)
+        self.cover_cache = OrderedDict()
         self.max_cache_size = 100
+        
+        # Websigns with no cover in the library, so revisits skip the directory walk
+        self._missing_covers = set()
+        
+        # websign -> ZIP path found by an earlier directory walk
+        self._zip_paths = {}
     
     def show_web_setting_dialog(self):
         """Show web setting configuration dialog"""
@@ -232,6 +241,7 @@ class WebController:
             if new_lib_path:
                 self.lib_path_value = new_lib_path
                 self.config_manager.set_lib_path(new_lib_path)
+                self.forget_missing_covers()
                 QMessageBox.information(self.main_window, "Settings Saved", f"Library path saved:\n{new_lib_path}")
                 dialog.accept()
             else:
@@ -318,11 +328,16 @@ class WebController:
             
             # Check cache first
             if cache_key in self.cover_cache:
+                self.cover_cache.move_to_end(cache_key)
                 return self.cover_cache[cache_key]
             
+            if websign in self._missing_covers:
+                return None
+            
             # Find ZIP file path
             zip_path = self.find_zip_file_by_websign(websign)
             if not zip_path:
+                self._missing_covers.add(websign)
                 return None
             
             # Extract cover image with specified size
@@ -331,13 +346,11 @@ class WebController:
             cover_pixmap = zip_manager.extract_cover_image(zip_path, size)
             
             if cover_pixmap:
-                # Cache management
-                if len(self.cover_cache) >= self.max_cache_size:
-                    # Remove oldest entry (simple FIFO)
-                    oldest_key = next(iter(self.cover_cache))
-                    del self.cover_cache[oldest_key]
-                
                 self.cover_cache[cache_key] = cover_pixmap
+                
+                # Evict least recently used entries
+                while len(self.cover_cache) > self.max_cache_size:
+                    self.cover_cache.popitem(last=False)
             
             return cover_pixmap
                 
@@ -345,8 +358,74 @@ class WebController:
             print(f"Error getting cover image for {websign}: {e}")
             return None
 
+    def get_cover_qimage(self, websign, size=None):
+        """
+        Get cover image for websign as a QImage
+        Safe to call from worker threads (no QPixmap, no shared cache)
+        Scaled covers are persisted to disk so later runs skip the ZIP decode
+        
+        Args:
+            websign: Comic identifier
+            size: Optional (width, height) for scaling
+        
+        Returns:
+            QImage of the cover image, or None
+        """
+        try:
+            if websign in self._missing_covers:
+                return None
+            
+            zip_path = self.find_zip_file_by_websign(websign)
+            if not zip_path:
+                self._missing_covers.add(websign)
+                return None
+            
+            # Pre-scaled thumbnail from an earlier run (a failed load just means a miss);
+            # keyed by the ZIP's mtime and size, so a replaced ZIP is decoded again
+            cache_path = cover_cache_path(websign, zip_path, size[0], size[1]) if size else None
+            if cache_path:
+                image = QImage(cache_path)
+                if not image.isNull():
+                    touch_cached_cover(cache_path)
+                    return image
+            
+            from models.zip_image_manager import ZipImageManager
+            image = ZipImageManager.extract_cover_qimage(zip_path, size)
+            
+            # Best effort: a cache that cannot be written still returns the cover
+            if image is not None and cache_path:
+                save_cached_cover(image, cache_path)
+            
+            return image
+        
+        except Exception as e:
+            print(f"Error getting cover image for {websign}: {e}")
+            return None
+
+    def has_no_cover(self, websign):
+        """
+        Check whether websign is already known to have no cover
+        
+        Args:
+            websign: Comic identifier
+        
+        Returns:
+            bool: True if an earlier lookup found no ZIP file
+        """
+        return websign in self._missing_covers
+
+    def forget_missing_covers(self):
+        """Forget missing covers and found ZIP paths, so they are looked up again"""
+        self._missing_covers.clear()
+        self._zip_paths.clear()
+
     def find_zip_file_by_websign(self, websign):
         """Find ZIP file path by websign number"""
+        # Reuse an earlier walk's result while the file is still there
+        zip_path = self._zip_paths.get(websign)
+        if zip_path and os.path.isfile(zip_path):
+            return zip_path
+        
         lib_path = self.config_manager.get_lib_path()
         if not lib_path or not os.path.exists(lib_path):
             return None
@@ -356,7 +435,9 @@ class WebController:
         
         for root, dirs, files in os.walk(lib_path):
             if zip_filename in files:
-                return os.path.join(root, zip_filename)
+                zip_path = os.path.join(root, zip_filename)
+                self._zip_paths[websign] = zip_path
+                return zip_path
         
         return None
 
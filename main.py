@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 import sys
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtGui import QIcon, QPixmapCache
 from views.main_window import MainWindow
 
 def main():
@@ -11,6 +12,12 @@ def main():
     app.setApplicationName("LB Manager")
     app.setApplicationDisplayName("LB Manager")
     
+    # Room for scaled cover thumbnails shared across grid cards (KB)
+    QPixmapCache.setCacheLimit(100 * 1024)
+    
+    # Cap background cover decoding so it does not saturate the disk
+    QThreadPool.globalInstance().setMaxThreadCount(4)
+    
     # Set application-wide icon
     # Note: Use absolute path or ensure icon.png is in the same directory
     try:
@@ -8,6 +8,9 @@ from typing import List, Dict, Any, Optional, Union
 import time
 from enum import Enum
 
+# Set True to log visible-row rebuilds and filter changes
+_DEBUG = False
+
 
 class ReadStatus(Enum):
     """Enum for read status to avoid string comparisons"""
@@ -32,12 +35,15 @@ class ReadStatus(Enum):
     
     def to_color(self) -> str:
         """Get color for this status"""
-        colors = {
-            ReadStatus.UNREAD: '#e74c3c',     # Red
-            ReadStatus.READING: '#f39c12',    # Orange
-            ReadStatus.COMPLETED: '#27ae60'   # Green
-        }
-        return colors.get(self, '#95a5a6')
+        return _READ_STATUS_COLORS.get(self, '#95a5a6')
+
+
+# Defined after the enum so the members can be used as keys
+_READ_STATUS_COLORS = {
+    ReadStatus.UNREAD: '#e74c3c',     # Red
+    ReadStatus.READING: '#f39c12',    # Orange
+    ReadStatus.COMPLETED: '#27ae60'   # Green
+}
 
 
 class VirtualDataModel(QAbstractTableModel):
@@ -311,6 +317,44 @@ class VirtualDataModel(QAbstractTableModel):
         
         return self._tuple_to_dict(self._raw_data[actual_row])
     
+    def get_column_values(self, column: str, first_row: int, last_row: int) -> List[Any]:
+        """
+        Get one column's raw values for a range of visible rows
+        Avoids building a full row dictionary per row
+        
+        Args:
+            column: Column name
+            first_row: First visible row index (inclusive)
+            last_row: Last visible row index (inclusive)
+        
+        Returns:
+            List of raw values, in visible row order
+        """
+        col = self.COLUMN_INDEX[column]
+        first_row = max(first_row, 0)
+        last_row = min(last_row, len(self._visible_rows) - 1)
+        
+        return [self._raw_data[actual_row][col]
+                for actual_row in self._visible_rows[first_row:last_row + 1]]
+    
+    def get_column_values_for_rows(self, column: str, rows: List[int]) -> List[Any]:
+        """
+        Get one column's raw values for a set of visible rows in one call
+        
+        Args:
+            column: Column name
+            rows: Visible row indices
+        
+        Returns:
+            List of raw values in the order of rows (None for invalid rows)
+        """
+        col = self.COLUMN_INDEX[column]
+        visible_rows = self._visible_rows
+        row_count = len(visible_rows)
+        
+        return [self._raw_data[visible_rows[row]][col] if 0 <= row < row_count else None
+                for row in rows]
+    
     def get_raw_row_index(self, visible_row: int) -> int:
         """Get actual row index in raw data from visible row index"""
         if visible_row < 0 or visible_row >= len(self._visible_rows):
@@ -487,15 +531,17 @@ class VirtualDataModel(QAbstractTableModel):
             self._filter_active = False
             return
         
-        self._visible_rows = []
         self._filter_active = True
         
-        for i, row_data in enumerate(self._raw_data):
-            # Check all filters
-            if self._should_row_be_visible(row_data, i):
-                self._visible_rows.append(i)
+        # Single pass over raw tuples, checking all filters
+        should_be_visible = self._should_row_be_visible
+        self._visible_rows = [
+            i for i, row_data in enumerate(self._raw_data)
+            if should_be_visible(row_data, i)
+        ]
         
-        print(f"Rebuilt visible rows: {len(self._visible_rows)}/{len(self._raw_data)} visible")
+        if _DEBUG:
+            print(f"Rebuilt visible rows: {len(self._visible_rows)}/{len(self._raw_data)} visible")
 
     def _is_row_in_text_filter(self, row_index: int, row_data: tuple) -> bool:
         """
@@ -556,16 +602,14 @@ class VirtualDataModel(QAbstractTableModel):
         if not self._filters and not self._text_filter_active and not self._custom_filter_active:
             return True
         
-        # Check status filter
+        # Check status filter (read tuple fields directly, no dict conversion)
         if 'status' in self._filters:
-            row_dict = self._tuple_to_dict(row_data)
-            if row_dict.get('read_status', '').lower() != self._filters['status']:
+            if row_data[self.COLUMN_INDEX['read_status']].lower() != self._filters['status']:
                 return False
         
         # Check tag filter
         if 'tags' in self._filters:
-            row_dict = self._tuple_to_dict(row_data)
-            row_tags = [tag.strip() for tag in row_dict.get('tag', '').split(',') if tag.strip()]
+            row_tags = [tag.strip() for tag in row_data[self.COLUMN_INDEX['tag']].split(',') if tag.strip()]
             filter_tags = self._filters['tags']
             
             if not any(tag in filter_tags for tag in row_tags):
@@ -691,6 +735,28 @@ class VirtualDataModel(QAbstractTableModel):
         
         return result
     
+    def prefetch(self, first_row: int, last_row: int) -> None:
+        """
+        Warm the display cache for a range of visible rows
+        
+        Args:
+            first_row: First visible row index (inclusive)
+            last_row: Last visible row index (inclusive)
+        """
+        first_row = max(first_row, 0)
+        last_row = min(last_row, len(self._visible_rows) - 1)
+        if first_row > last_row:
+            return
+        
+        role = Qt.ItemDataRole.DisplayRole
+        for row in range(first_row, last_row + 1):
+            actual_row = self._visible_rows[row]
+            for col in range(len(self.COLUMNS)):
+                cache_key = f"{actual_row}_{col}_{role}"
+                if cache_key not in self._display_cache:
+                    raw_value = self._get_raw_value(actual_row, col)
+                    self._display_cache[cache_key] = self._process_data(raw_value, col, role)
+    
     def _invalidate_caches(self) -> None:
         """Invalidate performance caches"""
         self._display_cache.clear()
@@ -1163,7 +1229,8 @@ class VirtualDataModel(QAbstractTableModel):
         # Rebuild visible rows
         self._rebuild_visible_rows()
         
-        print(f"Applied text filter: {self._text_filter_active}")
+        if _DEBUG:
+            print(f"Applied text filter: {self._text_filter_active}")
 
     def clear_text_filter(self) -> None:
         """
@@ -1173,7 +1240,8 @@ class VirtualDataModel(QAbstractTableModel):
         self._text_filter_active = False
         self._rebuild_visible_rows()
         
-        print("Cleared text filter")
+        if _DEBUG:
+            print("Cleared text filter")
 
     def set_row_background(self, visible_row: int, color: Union[str, QColor]) -> bool:
         """
@@ -519,6 +519,12 @@ class ZipImageManager(QObject):
             
             if success:
                 self.deletion_history.clear()
+                
+                # First image may have changed; drop stale cover thumbnails
+                from utils.helpers import remove_cached_covers
+                websign = os.path.splitext(os.path.basename(self.current_zip_path))[0]
+                remove_cached_covers(websign)
+                
                 print("Successfully committed deletions")
                 return True
             else:
@@ -544,6 +550,25 @@ class ZipImageManager(QObject):
         Returns:
             QPixmap of the cover image
         """
+        image = self.extract_cover_qimage(zip_path, size)
+        if image is None:
+            return None
+        # Covers are small and shown once; skip the conversion pass to the screen format
+        return QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
+    
+    @staticmethod
+    def extract_cover_qimage(zip_path, size=None):
+        """
+        Extract first image from ZIP as cover, without touching QPixmap
+        Safe to call from worker threads
+        
+        Args:
+            zip_path: Path to ZIP file
+            size: Optional tuple (width, height) to scale into, keeping aspect ratio
+        
+        Returns:
+            QImage of the cover image, or None
+        """
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 # Get image files sorted by name
@@ -560,24 +585,20 @@ class ZipImageManager(QObject):
                 with zip_ref.open(first_image) as image_file:
                     image_data = image_file.read()
                 
-                # Create QPixmap from image data
+                # Decode image data
                 image = QImage()
                 if not image.loadFromData(image_data):
                     return None
                 
-                pixmap = QPixmap.fromImage(image)
-                
                 # Only scale if size is specified
                 if size:
                     # Use KeepAspectRatio to fit within size without cropping
-                    scaled_pixmap = pixmap.scaled(
+                    return image.scaled(
                         size[0], size[1], 
                         Qt.AspectRatioMode.KeepAspectRatio,
                         Qt.TransformationMode.SmoothTransformation
                     )
-                    return scaled_pixmap
-                else:
-                    return pixmap  # Return original size
+                return image  # Return original size
                     
         except Exception as e:
             print(f"Error extracting cover from {zip_path}: {e}")
@@ -3,7 +3,9 @@ import re
 import zipfile
 import os
 import shutil
-from typing import List
+import tempfile
+import threading
+from typing import Iterable, List, Optional, Tuple
 from PIL import Image
 import io
 
@@ -36,6 +38,141 @@ def save_numbers_to_file(numbers, filepath='./nums.txt'):
         for number in numbers:
             f.write(f"{number}\n")
 
+def rows_to_ranges(rows: Iterable[int]) -> List[Tuple[int, int]]:
+    """
+    Coalesce row indices into sorted, contiguous (start, end) ranges
+    
+    Args:
+        rows: Row indices in any order (duplicates allowed)
+    
+    Returns:
+        List of inclusive (start, end) tuples
+    """
+    ranges = []
+    for row in sorted(set(rows)):
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+# On-disk cache of scaled cover thumbnails (relative to the working directory, like config.ini)
+COVER_CACHE_DIR = './cover_cache'
+COVER_CACHE_MAX_FILES = 5000  # least recently used thumbnails beyond this are evicted
+
+# Writes between eviction passes, so saving a thumbnail rarely scans the directory
+_COVER_CACHE_PRUNE_EVERY = 100
+_cover_cache_writes = 0
+_cover_cache_prune_lock = threading.Lock()
+
+def cover_cache_path(websign, zip_path: str, width: int, height: int) -> Optional[str]:
+    """
+    Path of the cached cover thumbnail for websign scaled to fit (width, height)
+    The ZIP's mtime and size are part of the name, so a replaced ZIP misses
+    
+    Returns:
+        str path, or None if the ZIP cannot be read
+    """
+    try:
+        stat = os.stat(zip_path)
+    except OSError:
+        return None
+    return os.path.join(COVER_CACHE_DIR,
+                        f"{websign}_{width}x{height}_{stat.st_mtime_ns}_{stat.st_size}.png")
+
+def touch_cached_cover(path: str) -> None:
+    """Mark a cached cover thumbnail as recently used"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+def save_cached_cover(image, path: str) -> bool:
+    """
+    Save a cover thumbnail into the cache atomically
+    Safe to call from worker threads; readers never see a half-written file.
+    Best effort: an unwritable cache just returns False
+    
+    Args:
+        image: QImage to save
+        path: Target path from cover_cache_path()
+    
+    Returns:
+        bool: True if the thumbnail was written
+    """
+    global _cover_cache_writes
+    
+    temp_path = None
+    try:
+        os.makedirs(COVER_CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=COVER_CACHE_DIR)
+        os.close(fd)
+        if not image.save(temp_path, 'PNG'):
+            os.remove(temp_path)
+            return False
+        os.replace(temp_path, path)
+    except OSError:
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return False
+    
+    _cover_cache_writes += 1
+    if _cover_cache_writes % _COVER_CACHE_PRUNE_EVERY == 0:
+        prune_cover_cache()
+    return True
+
+def prune_cover_cache(max_files: int = COVER_CACHE_MAX_FILES) -> None:
+    """
+    Evict the least recently used cover thumbnails beyond max_files
+    
+    Args:
+        max_files: Number of thumbnails to keep
+    """
+    # One pass at a time; a concurrent caller just skips
+    if not _cover_cache_prune_lock.acquire(blocking=False):
+        return
+    try:
+        try:
+            entries = [entry for entry in os.scandir(COVER_CACHE_DIR)
+                       if entry.is_file() and entry.name.endswith('.png')]
+        except OSError:
+            return
+        
+        excess = len(entries) - max_files
+        if excess <= 0:
+            return
+        
+        def mtime(entry):
+            try:
+                return entry.stat().st_mtime
+            except OSError:
+                return 0
+        
+        entries.sort(key=mtime)
+        for entry in entries[:excess]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+    finally:
+        _cover_cache_prune_lock.release()
+
+def remove_cached_covers(websign) -> None:
+    """Delete every cached cover thumbnail for websign"""
+    if not os.path.isdir(COVER_CACHE_DIR):
+        return
+    
+    prefix = f"{websign}_"
+    for filename in os.listdir(COVER_CACHE_DIR):
+        if filename.startswith(prefix):
+            try:
+                os.remove(os.path.join(COVER_CACHE_DIR, filename))
+            except OSError:
+                pass
+
 def delete_from_zip(zip_path: str, files_to_delete: List[str]) -> bool:
     """
     Delete files from ZIP by creating a new ZIP without the specified files
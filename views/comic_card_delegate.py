@@ -6,11 +6,20 @@ Manages widget pooling and image loading
 from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QApplication, QStyleOptionViewItem, QFrame
 from PyQt6.QtCore import Qt, QSize, QRect, QTimer, QEvent, QPoint
 from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap, QPalette
-from .widget_pool import WidgetPool, ComicCardWidget
+from .widget_pool import WidgetPool, ComicCardWidget, STATUS_TEXT
 import time
 from typing import Optional, Dict, Any
 
 
+# Status badge colors (built once at import)
+_STATUS_COLORS = {
+    'unread': QColor(231, 76, 60),    # Red
+    'reading': QColor(243, 156, 18),  # Orange
+    'completed': QColor(39, 174, 96)  # Green
+}
+_STATUS_COLOR_UNKNOWN = QColor(149, 165, 166)  # Gray
+
+
 class ComicCardDelegate(QStyledItemDelegate):
     """
     Delegate for rendering comic cards with widget pooling
@@ -43,11 +52,9 @@ class ComicCardDelegate(QStyledItemDelegate):
         self.card_size = QSize(140, 250)
         self.cover_size = QSize(120, 170)
         
-        # Connect to model signals if available
-        model = main_window.table.get_model()
-        model.dataChanged.connect(self.on_model_data_changed)
-        model.layoutChanged.connect(self.on_model_layout_changed)
-                
+        # Model signals (dataChanged, layoutChanged) are handled by the view,
+        # which owns the visible widgets and releases them back to the pool
+        
     def sizeHint(self, option, index):
         """
         Return fixed size for all items
@@ -122,10 +129,6 @@ class ComicCardDelegate(QStyledItemDelegate):
         padding = 8
         
         # Title (top area)
-        title = row_data.get('title', '')
-        if len(title) > 10:
-            title = title[:8] + '...'
-            
         title_rect = QRect(
             rect.left() + padding,
             rect.top() + self.cover_size.height() + padding * 2,
@@ -139,7 +142,10 @@ class ComicCardDelegate(QStyledItemDelegate):
         font.setBold(True)
         font.setPointSize(10)
         painter.setFont(font)
-        painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, title)
+        title = painter.fontMetrics().elidedText(
+            row_data.get('title', ''), Qt.TextElideMode.ElideRight, title_rect.width()
+        )
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, title)
         painter.restore()
         
         # Author (middle area)
@@ -161,17 +167,8 @@ class ComicCardDelegate(QStyledItemDelegate):
         
         # Status (bottom area)
         status = row_data.get('read_status', 'unread')
-        status_text = {
-            'unread': 'Unread',
-            'reading': 'Reading',
-            'completed': 'Completed'
-        }.get(status, status)
-        
-        status_color = {
-            'unread': QColor(231, 76, 60),    # Red
-            'reading': QColor(243, 156, 18),  # Orange
-            'completed': QColor(39, 174, 96)  # Green
-        }.get(status, QColor(149, 165, 166))  # Gray
+        status_text = STATUS_TEXT.get(status, status)
+        status_color = _STATUS_COLORS.get(status, _STATUS_COLOR_UNKNOWN)
         
         status_rect = QRect(
             rect.left() + padding,
@@ -319,33 +316,11 @@ class ComicCardDelegate(QStyledItemDelegate):
             
             for row, widget in visible_widgets:
                 # Schedule image loading
-                QTimer.singleShot(0, widget.load_cover_image)
+                self.widget_pool.queue_cover(row)
                     
         finally:
             self.is_loading_images = False
             
-    def on_model_data_changed(self, top_left, bottom_right, roles):
-        """
-        Handle model data changes
-        """
-        # Update affected widgets
-        for row in range(top_left.row(), bottom_right.row() + 1):
-            widget = self.widget_pool.get_widget_for_row(row)
-            if widget:
-                # Get updated row data from model
-                model = self.parent_view.model()
-                if model:
-                    row_data = self.get_row_data(row, model)
-                    if row_data:
-                        widget.update_content(row_data, row)  # Pass arguments!
-                
-    def on_model_layout_changed(self):
-        """
-        Handle model layout changes (sorting, filtering)
-        """
-        # Invalidate widget pool
-        self.widget_pool.invalidate_all()
-        
     def get_widget_pool_stats(self):
         """
         Get widget pool statistics
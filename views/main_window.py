@@ -70,8 +70,8 @@ class MainWindow(QMainWindow):
         self.table_controller.rebuild_websign_tracker()
         self.table_controller.data_added.connect(self.update_sidebar_counts)
         self.table_controller.filter_state_changed.connect(self.on_filter_state_changed)
-        # self.grid_view.selection_changed.connect(self.on_grid_selection_changed)
-        self.grid_view.selectionModel().selectionChanged.connect(self.on_grid_selection_changed)
+        # Grid selection changes reach on_grid_selection_changed through
+        # VirtualGridView.selectionChanged; connecting here would run it twice
         
         # Step 9: Load saved view preference
         self.load_view_preference()
@@ -458,8 +458,7 @@ class MainWindow(QMainWindow):
             self.table.viewport().update()
             
             # Clear grid view if it exists
-            self.grid_view._clear_all_widgets()
-            QTimer.singleShot(50, self.grid_view.update_visible_items)
+            self.grid_view.schedule_refresh(clear=True)
             
             # Update sidebar counts
             self.update_sidebar_counts()
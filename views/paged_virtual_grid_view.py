@@ -6,11 +6,18 @@ from PyQt6.QtWidgets import (
     QListView, QAbstractItemView, QApplication, QFrame, 
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, QComboBox
 )
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QRect, QModelIndex
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, pyqtSignal, QRect, QModelIndex,
+    QItemSelection, QItemSelectionModel, QItemSelectionRange
+)
 from PyQt6.QtGui import QPalette
 import time
 from .comic_card_delegate import ComicCardDelegate
 from .virtual_grid_view import VirtualGridView
+from utils.helpers import rows_to_ranges
+
+# Set True to log page changes
+_DEBUG = False
 
 
 class PagedVirtualGridView(QWidget):
@@ -149,8 +156,9 @@ class PagedVirtualGridView(QWidget):
             # Update pagination info
             self.total_pages = max(1, (total_rows + self.items_per_page - 1) // self.items_per_page)
             
-            print(f"[PagedVirtualGridView] Page {self.current_page + 1}/{self.total_pages}, " 
-                f"showing rows {start_idx}-{end_idx}")
+            if _DEBUG:
+                print(f"[PagedVirtualGridView] Page {self.current_page + 1}/{self.total_pages}, " 
+                    f"showing rows {start_idx}-{end_idx}")
         else:
             # Handle empty model
             self._visible_rows = []
@@ -234,24 +242,39 @@ class PagedVirtualGridView(QWidget):
         Args:
             selected_rows_set: Set of row indices in full model to select
         """
-        self.grid_view.selectionModel().clearSelection()
+        self.sync_selection_with_grid_ranges(rows_to_ranges(selected_rows_set))
         
-        # Convert full model rows to visible rows
-        visible_selections = []
-        for full_row in selected_rows_set:
-            if full_row in self._visible_rows:
-                visible_row = self._visible_rows.index(full_row)
-                visible_selections.append(visible_row)
-                
-        # Select in grid view
+    def sync_selection_with_grid_ranges(self, ranges):
+        """
+        Sync selection from other view using contiguous row ranges
+        
+        Args:
+            ranges: List of inclusive (start, end) row ranges in full model
+        """
+        selection_model = self.grid_view.selectionModel()
         model = self.grid_view.model()
-        if model:
-            for visible_row in visible_selections:
-                index = model.index(visible_row, 0)
-                self.grid_view.selectionModel().select(
-                    index, 
-                    self.grid_view.selectionModel().SelectionFlag.Select
-                )
+        if not model or not self._visible_rows:
+            selection_model.clearSelection()
+            return
+            
+        # Current page is a contiguous block of full model rows
+        page_start = self._visible_rows[0]
+        page_end = self._visible_rows[-1]
+        
+        # Whole-row ranges let Qt keep one range per run instead of per cell
+        last_col = model.columnCount() - 1
+        selection = QItemSelection()
+        for start, end in ranges:
+            start = max(start, page_start)
+            end = min(end, page_end)
+            if start <= end:
+                selection.append(QItemSelectionRange(
+                    model.index(start - page_start, 0),
+                    model.index(end - page_start, last_col)
+                ))
+                
+        # Replace the whole selection in one update
+        selection_model.select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
                 
     def refresh_page(self):
         """Refresh current page"""
@@ -6,7 +6,13 @@ from PyQt6.QtWidgets import QListView, QAbstractItemView, QApplication, QFrame
 from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QRect, QModelIndex
 from PyQt6.QtGui import QPalette, QPainter
 from .comic_card_delegate import ComicCardDelegate
+from .widget_pool import CARD_STYLESHEET
 import time
+from contextlib import contextmanager
+from functools import partial
+
+# Set True to log manual refreshes
+_DEBUG = False
 
 class VirtualGridView(QListView):
     """True virtualized grid view with precise spacing control"""
@@ -40,9 +46,26 @@ class VirtualGridView(QListView):
         # Set no frame
         self.setFrameShape(QFrame.Shape.NoFrame)
         
+        # Cards live on the viewport and share one stylesheet
+        self.viewport().setStyleSheet(CARD_STYLESHEET)
+        
         # Widget management
         self._visible_widgets = {}  # row -> widget
+        self._last_visible_range = None  # (start_row, end_row) of the last update
         self._pending_updates = False
+        self._updates_suspended = 0  # nesting depth of _suspend_viewport_updates
+        
+        # Coalesced refresh: bursts of model signals trigger one update
+        self._needs_clear = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(10)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
+        # Incremental widget creation (a few widgets per event-loop turn)
+        self._create_batch_size = 4
+        self._pending_rows = []
+        self._create_epoch = 0
         
         # Performance monitoring
         self._last_scroll_time = 0
@@ -62,6 +85,43 @@ class VirtualGridView(QListView):
         # Schedule initial layout
         QTimer.singleShot(100, self.update_widget_positions)
         
+    @contextmanager
+    def _suspend_viewport_updates(self):
+        """
+        Suppress viewport repaints for the duration of a bulk widget update
+        
+        Nested uses only re-enable updates when the outermost block exits,
+        so the viewport repaints once for the whole operation.
+        """
+        viewport = self.viewport()
+        if self._updates_suspended == 0:
+            viewport.setUpdatesEnabled(False)
+        self._updates_suspended += 1
+        try:
+            yield viewport
+        finally:
+            self._updates_suspended -= 1
+            if self._updates_suspended == 0:
+                viewport.setUpdatesEnabled(True)
+                
+    def schedule_refresh(self, clear=False):
+        """
+        Schedule a coalesced update of visible items
+        
+        Args:
+            clear: Release all widgets before updating
+        """
+        if clear:
+            self._needs_clear = True
+        self._refresh_timer.start()
+        
+    def _do_refresh(self):
+        """Run the single update for a burst of refresh requests"""
+        if self._needs_clear:
+            self._needs_clear = False
+            self._clear_all_widgets()
+        self.update_visible_items()
+        
     def update_visible_items(self):
         """Update which items have widget representation"""
         if not self.model():
@@ -102,25 +162,64 @@ class VirtualGridView(QListView):
         start_row = max(0, start_row - buffer_grid_y * columns_per_row)
         end_row = min(model.rowCount() - 1, end_row + buffer_grid_y * columns_per_row)
         
-        # Create/update widgets
-        self._update_widgets_for_rows(start_row, end_row)
+        # Release, refill and move widgets as one repaint per scroll tick
+        with self._suspend_viewport_updates():
+            # Create/update widgets
+            self._update_widgets_for_rows(start_row, end_row)
+            
+            # Remove non-visible widgets
+            self._remove_non_visible_widgets(start_row, end_row)
+            
+            # Update positions
+            self.update_widget_positions()
         
-        # Remove non-visible widgets
-        self._remove_non_visible_widgets(start_row, end_row)
+        # Warm covers for the next screen of rows
+        self._preload_covers_after(end_row, end_row - start_row + 1)
         
-        # Update positions
-        self.update_widget_positions()
+    def _preload_covers_after(self, last_row, count):
+        """Preload covers for up to count rows following last_row"""
+        model = self.model()
+        values = model.get_column_values('websign', last_row + 1, last_row + count)
+        websigns = [str(websign) for websign in values if websign]
+        
+        self.delegate.widget_pool.preload_covers(websigns)
         
     def _update_widgets_for_rows(self, start_row, end_row):
         """Create or update widgets for specified rows"""
+        pending_rows = []
         for row in range(start_row, end_row + 1):
             if row not in self._visible_widgets:
-                # Create new widget for this row
-                self._create_widget_for_row(row)
+                # Queue new widget for this row
+                pending_rows.append(row)
             else:
                 # Update existing widget position
                 self._update_widget_position(row)
                 
+        # Replace any outstanding work from a previous update
+        self._pending_rows = pending_rows
+        self._create_epoch += 1
+        self._create_batch(self._create_epoch)
+        
+    def _create_batch(self, epoch):
+        """
+        Create the next batch of pending widgets, then yield to the event loop
+        A newer update bumps the epoch and cancels remaining batches
+        """
+        if epoch != self._create_epoch:
+            return
+            
+        batch = self._pending_rows[:self._create_batch_size]
+        del self._pending_rows[:self._create_batch_size]
+        
+        # Repaint the viewport once per batch instead of once per widget
+        with self._suspend_viewport_updates():
+            for row in batch:
+                if row not in self._visible_widgets:
+                    self._create_widget_for_row(row)
+                
+        if self._pending_rows:
+            QTimer.singleShot(0, partial(self._create_batch, epoch))
+                
     def _create_widget_for_row(self, row):
         """Create and position widget for a specific row"""
         if not self.model():
@@ -141,8 +240,9 @@ class VirtualGridView(QListView):
         if not widget:
             return
             
-        # Set widget parent to viewport
-        widget.setParent(self.viewport())
+        # Pooled widgets stay parented to the viewport; only reparent new ones
+        if widget.parentWidget() is not self.viewport():
+            widget.setParent(self.viewport())
         
         # Set widget position
         rect = self.visualRect(index)
@@ -177,30 +277,34 @@ class VirtualGridView(QListView):
         
     def _remove_non_visible_widgets(self, start_row, end_row):
         """Remove widgets for rows no longer visible"""
-        rows_to_remove = []
-        
-        for row in list(self._visible_widgets.keys()):
-            if row < start_row or row > end_row:
-                rows_to_remove.append(row)
+        last_range = self._last_visible_range
+        self._last_visible_range = (start_row, end_row)
+        
+        if last_range is not None and last_range[0] <= end_row and start_row <= last_range[1]:
+            # Windows overlap: only rows that slid off either edge can be stale
+            last_start, last_end = last_range
+            edge_rows = list(range(last_start, start_row)) + list(range(end_row + 1, last_end + 1))
+            rows_to_remove = [row for row in edge_rows if row in self._visible_widgets]
+        else:
+            rows_to_remove = [row for row in self._visible_widgets
+                              if row < start_row or row > end_row]
                 
         for row in rows_to_remove:
-            widget = self._visible_widgets[row]
-            
-            # Return widget to pool
+            # Return widget to pool (the pool hides it for reuse)
             self.delegate.widget_pool.release_widget(row)
             
-            # Remove from viewport
-            widget.hide()
-            widget.setParent(None)
-            
             del self._visible_widgets[row]
             
     def _clear_all_widgets(self):
         """Clear all widgets from viewport"""
-        for row, widget in list(self._visible_widgets.items()):
-            self.delegate.widget_pool.release_widget(row)
-            widget.hide()
-            widget.setParent(None)
+        # Cancel pending widget creation
+        self._pending_rows = []
+        self._create_epoch += 1
+        self._last_visible_range = None
+        
+        with self._suspend_viewport_updates():
+            for row in list(self._visible_widgets):
+                self.delegate.widget_pool.release_widget(row)
             
         self._visible_widgets.clear()
         
@@ -215,26 +319,27 @@ class VirtualGridView(QListView):
         if not self.model():
             return
             
-        viewport = self.viewport()
-        viewport_rect = viewport.rect()
+        viewport_rect = self.viewport().rect()
         
-        for row, widget in self._visible_widgets.items():
-            index = self.model().index(row, 0)
-            if index.isValid():
-                # Get viewport-relative position
-                rect = self.visualRect(index)
-                
-                # Check if widget is within or near viewport
-                widget_visible = rect.intersects(viewport_rect) or \
-                                rect.top() < viewport_rect.bottom() + 100 or \
-                                rect.bottom() > viewport_rect.top() - 100
-                
-                if widget_visible:
-                    widget.setGeometry(rect)
-                    widget.show()
-                else:
-                    # Widget is far outside viewport, hide it
-                    widget.hide()
+        # Move all widgets first, then repaint the viewport once
+        with self._suspend_viewport_updates():
+            for row, widget in self._visible_widgets.items():
+                index = self.model().index(row, 0)
+                if index.isValid():
+                    # Get viewport-relative position
+                    rect = self.visualRect(index)
+                    
+                    # Check if widget is within or near viewport
+                    widget_visible = rect.intersects(viewport_rect) or \
+                                    rect.top() < viewport_rect.bottom() + 100 or \
+                                    rect.bottom() > viewport_rect.top() - 100
+                    
+                    if widget_visible:
+                        widget.setGeometry(rect)
+                        widget.show()
+                    else:
+                        # Widget is far outside viewport, hide it
+                        widget.hide()
                 
     def resizeEvent(self, event):
         """
@@ -294,7 +399,7 @@ class VirtualGridView(QListView):
         if current_time - self._last_scroll_time > self._scroll_throttle_ms:
             self._last_scroll_time = current_time
             # Trigger deferred update
-            QTimer.singleShot(10, self.update_visible_items)
+            self.schedule_refresh()
 
     def on_item_clicked(self, index):
         """Simplest click handler - just select the item"""
@@ -351,25 +456,22 @@ class VirtualGridView(QListView):
                     widget.update_content(row_data, row)
         
         # Schedule view update
-        QTimer.singleShot(10, self.update_visible_items)
+        self.schedule_refresh()
 
     def _on_rows_inserted(self, parent, first, last):
         """Handle rows being inserted"""
-        # Clear all widgets and rebuild
-        self._clear_all_widgets()
-        
-        # Update visible items
-        QTimer.singleShot(50, self.update_visible_items)
+        # Clear all widgets and rebuild (once per burst of inserts)
+        self.schedule_refresh(clear=True)
 
     def _on_rows_removed(self, parent, first, last):
         """Handle rows being removed"""
+        # Remaining widgets may no longer match the last window; rescan next time
+        self._last_visible_range = None
+        
         # Remove widgets for removed rows
         for row in range(first, last + 1):
             if row in self._visible_widgets:
-                widget = self._visible_widgets[row]
                 self.delegate.widget_pool.release_widget(row)
-                widget.hide()
-                widget.setParent(None)
                 del self._visible_widgets[row]
         
         # Update remaining widget positions
@@ -377,11 +479,8 @@ class VirtualGridView(QListView):
 
     def _on_model_layout_changed(self):
         """Handle layout changes (sorting, filtering)"""
-        # Clear all widgets and rebuild
-        self._clear_all_widgets()
-        
-        # Update visible items
-        QTimer.singleShot(50, self.update_visible_items)
+        # Clear all widgets and rebuild (once per burst of changes)
+        self.schedule_refresh(clear=True)
 
     def indexAt(self, point):
         """
@@ -448,7 +547,8 @@ class VirtualGridView(QListView):
 
     def refresh(self):
         """Manually refresh the grid view"""
-        print("[VirtualGridView] Manual refresh called")
+        if _DEBUG:
+            print("[VirtualGridView] Manual refresh called")
         self._clear_all_widgets()
         self.update_visible_items()
 
@@ -480,15 +580,16 @@ class VirtualGridView(QListView):
         Returns:
             List[int]: List of selected row indices (sorted)
         """
-        selected_indexes = self.selectedIndexes()
+        selection_model = self.selectionModel()
+        if not selection_model:
+            return []
         
-        # Get unique rows
+        # Expand selection ranges directly instead of building a QModelIndex per item
         rows = set()
-        for index in selected_indexes:
-            if index.isValid():
-                rows.add(index.row())  # This is MODEL row index
+        for selection_range in selection_model.selection():
+            rows.update(range(selection_range.top(), selection_range.bottom() + 1))
         
-        return sorted(list(rows))
+        return sorted(rows)
     
     def selectionChanged(self, selected, deselected):
         """Handle selection changes"""
@@ -509,16 +610,19 @@ class VirtualGridView(QListView):
         if not self.model():
             return
             
-        for row, widget in self._visible_widgets.items():
+        for row in self._visible_widgets:
             # Schedule image loading
-            QTimer.singleShot(0, widget.load_cover_image)
+            self.delegate.widget_pool.queue_cover(row)
 
     def refresh_images(self):
         """Refresh all visible widget images"""
+        # Pick up ZIP files added to the library since the last lookup
+        self.main_window.web_controller.forget_missing_covers()
+        
         # Reload images for all visible widgets
-        for row, widget in self._visible_widgets.items():
-            # Use singleShot to prevent UI freezing
-            QTimer.singleShot(0, widget.load_cover_image)
+        for row in self._visible_widgets:
+            # Queued loads are started together by the pool
+            self.delegate.widget_pool.queue_cover(row)
         
         # Also update visible items to catch any new widgets
         self.update_visible_items()
\ No newline at end of file
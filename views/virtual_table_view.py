@@ -3,10 +3,15 @@ Virtual Table View optimized for large datasets
 Replaces EnhancedTableWidget with QTableView + VirtualDataModel
 """
 from PyQt6.QtWidgets import QTableView, QHeaderView, QMenu, QApplication, QAbstractItemView
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QModelIndex
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QModelIndex, QItemSelection, QItemSelectionModel, QItemSelectionRange
+)
 from PyQt6.QtGui import QAction
 from models.virtual_data_model import VirtualDataModel
-import time
+
+
+# Three-state sort cycle: none → ascending → descending → none
+_NEXT_SORT_STATE = {"none": "asc", "asc": "desc", "desc": "none"}
 
 
 class VirtualTableView(QTableView):
@@ -18,14 +23,23 @@ class VirtualTableView(QTableView):
     itemSelectionChanged = pyqtSignal()  # Compat with QTableWidget signal
     rowDoubleClicked = pyqtSignal(QModelIndex)  # Compat signal
     
+    # Selection flag for whole-row selection
+    _SELECT_ROW_FLAG = QItemSelectionModel.SelectionFlag.Select | QItemSelectionModel.SelectionFlag.Rows
+    
     def __init__(self, main_window=None, parent=None):
         super().__init__(parent)
         self.main_window = main_window  # Store reference to main_window
+        self.setObjectName("VirtualTableView")  # Target for application-level QSS
         
         # Initialize data model
         self.data_model = VirtualDataModel()
         self.setModel(self.data_model)
         
+        # Cache last column index for whole-row selection ranges
+        self._last_col = self.data_model.columnCount() - 1
+        self.data_model.columnsInserted.connect(self._update_last_col)
+        self.data_model.columnsRemoved.connect(self._update_last_col)
+        
         # Disable built-in sorting, use custom three-state sorting
         self.setSortingEnabled(False)
         self.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
@@ -34,11 +48,17 @@ class VirtualTableView(QTableView):
         self.sort_states = {}  # column_index -> "none", "asc", "desc"
         self.current_sort_column = -1
         
-        # Selection tracking
-        self.last_selection_time = 0
-        self.selection_debounce_timer = QTimer()
+        # Selection tracking (timeout forwards directly to compat signal)
+        self.selection_debounce_timer = QTimer(self)
         self.selection_debounce_timer.setSingleShot(True)
-        self.selection_debounce_timer.timeout.connect(self._emit_selection_changed)
+        self.selection_debounce_timer.setInterval(50)  # 50ms debounce
+        self.selection_debounce_timer.timeout.connect(self.itemSelectionChanged)
+        
+        # Viewport prefetch (runs once scrolling settles)
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(50)
+        self.prefetch_timer.timeout.connect(self.prefetch_visible)
         
         # Initialize UI
         self.init_ui()
@@ -91,7 +111,10 @@ class VirtualTableView(QTableView):
         self.horizontalHeader().customContextMenuRequested.connect(self.show_header_context_menu)
         
         # Selection change signal (with debouncing)
-        self.selectionModel().selectionChanged.connect(self._on_selection_changed_debounced)
+        self.selectionModel().selectionChanged.connect(self.selection_debounce_timer.start)
+        
+        # Prefetch visible rows after scrolling (with debouncing)
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll_value_changed)
     
     # ==================== Data Management (Compatibility Layer) ====================        
     def rowCount(self):
@@ -118,15 +141,7 @@ class VirtualTableView(QTableView):
         Handle header click for three-state sorting
         State cycle: none → ascending → descending → none
         """
-        current_state = self.sort_states.get(logical_index, "none")
-        
-        # Determine next state in cycle
-        if current_state == "none":
-            new_state = "asc"
-        elif current_state == "asc":
-            new_state = "desc"
-        else:  # "desc"
-            new_state = "none"
+        new_state = _NEXT_SORT_STATE[self.sort_states.get(logical_index, "none")]
         
         # Apply the new sorting state
         self.apply_sort(logical_index, new_state)
@@ -142,13 +157,6 @@ class VirtualTableView(QTableView):
         else:
             super().mouseDoubleClickEvent(event)
 
-    def _on_selection_changed(self, selected, deselected):
-        """
-        Handle selection changes
-        """
-        # Simply emit the signal
-        self.itemSelectionChanged.emit()
-    
     def apply_sort(self, column, sort_state):
         """
         Apply sorting state to specified column
@@ -208,21 +216,6 @@ class VirtualTableView(QTableView):
     
     # ==================== Selection Handling ====================
     
-    def _on_selection_changed_debounced(self, selected, deselected):
-        """Debounced selection change handler"""
-        current_time = time.time()
-        
-        # If selection changed very recently, restart timer
-        if current_time - self.last_selection_time < 0.1:
-            self.selection_debounce_timer.stop()
-        
-        self.selection_debounce_timer.start(50)  # 50ms debounce
-        self.last_selection_time = current_time
-    
-    def _emit_selection_changed(self):
-        """Emit selection changed signal after debouncing"""
-        self.itemSelectionChanged.emit()
-    
     def get_selected_rows(self):
         """
         Get all selected row indices
@@ -256,11 +249,15 @@ class VirtualTableView(QTableView):
     def selectRow(self, row):
         """Select a specific row"""
         if 0 <= row < self.data_model.rowCount():
-            index = self.model().index(row, 0)
-            self.selectionModel().select(
-                index,
-                self.selectionModel().SelectionFlag.Select | self.selectionModel().SelectionFlag.Rows
-            )
+            # One range spanning all columns, so Qt does not expand it per cell
+            model = self.model()
+            selection = QItemSelection()
+            selection.append(QItemSelectionRange(model.index(row, 0), model.index(row, self._last_col)))
+            self.selectionModel().select(selection, self._SELECT_ROW_FLAG)
+    
+    def _update_last_col(self, *args):
+        """Refresh cached last column index after column count changes"""
+        self._last_col = self.data_model.columnCount() - 1
     
     # ==================== Header Context Menu ====================
     
@@ -325,6 +322,38 @@ class VirtualTableView(QTableView):
         """Get performance statistics"""
         return self.data_model.get_performance_stats()
     
+    def visible_row_range(self):
+        """
+        Get the range of rows currently shown in the viewport
+        
+        Returns:
+            Tuple[int, int]: (first_row, last_row), or (-1, -1) if empty
+        """
+        row_count = self.data_model.rowCount()
+        if row_count == 0:
+            return -1, -1
+        
+        first = self.rowAt(0)
+        last = self.rowAt(self.viewport().height() - 1)
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = row_count - 1
+        return first, last
+    
+    def _on_scroll_value_changed(self, _value):
+        """Restart the prefetch timer without passing the scroll value as its interval"""
+        self.prefetch_timer.start()
+    
+    def prefetch_visible(self):
+        """Prefetch model data for the visible rows plus one viewport either side"""
+        first, last = self.visible_row_range()
+        if first < 0:
+            return
+        
+        buffer = last - first + 1
+        self.data_model.prefetch(first - buffer, last + buffer)
+    
     # ==================== Public API for Controllers ====================
     
     def add_row_data(self, data_tuple):
@@ -334,12 +363,8 @@ class VirtualTableView(QTableView):
             data_tuple: Tuple of 11 values in correct column order
         """
         # Convert tuple to dict for model
-        data_dict = {}
-        for i, col_def in enumerate(self.data_model.COLUMNS):
-            if i < len(data_tuple):
-                data_dict[col_def['name']] = data_tuple[i]
-        
-        self.data_model.add_row(data_dict)
+        col_names = [col_def['name'] for col_def in self.data_model.COLUMNS]
+        self.data_model.add_row(dict(zip(col_names, data_tuple)))
     
     def add_rows_data(self, rows_data):
         """
@@ -347,13 +372,8 @@ class VirtualTableView(QTableView):
         Args:
             rows_data: List of tuples, each with 11 values
         """
-        data_dicts = []
-        for data_tuple in rows_data:
-            data_dict = {}
-            for i, col_def in enumerate(self.data_model.COLUMNS):
-                if i < len(data_tuple):
-                    data_dict[col_def['name']] = data_tuple[i]
-            data_dicts.append(data_dict)
+        col_names = [col_def['name'] for col_def in self.data_model.COLUMNS]
+        data_dicts = [dict(zip(col_names, data_tuple)) for data_tuple in rows_data]
         
         self.data_model.add_rows(data_dicts)
     
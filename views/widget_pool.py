@@ -2,13 +2,228 @@
 Widget pool for managing reusable comic card widgets
 Fixed number of QWidget instances are reused as user scrolls
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QWidget, QLabel, QFrame, QSizePolicy
+from PyQt6.QtCore import Qt, QObject, QTimer, QRect, pyqtSignal, QRunnable, QThreadPool
+from PyQt6.QtGui import (
+    QPixmap, QImage, QPixmapCache, QPainter, QColor, QFont, QFontMetrics, QGuiApplication
+)
 import time
 from typing import Dict, List, Tuple, Optional, Set, Any
 
 
+# Status label text (shared with the delegate)
+STATUS_TEXT = {
+    'unread': 'Unread',
+    'reading': 'Reading',
+    'completed': 'Completed'
+}
+
+# Shared stylesheet for all cards, installed once on their parent
+# Variants are selected with dynamic properties instead of per-widget stylesheets
+CARD_STYLESHEET = """
+    ComicCardWidget {
+        background-color: white;
+        border: 1px solid #dee2e6;
+        border-radius: 6px;
+    }
+    ComicCardWidget:hover {
+        background-color: #f8f9fa;
+        border: 1px solid #adb5bd;
+    }
+    ComicCardWidget[selected="true"],
+    ComicCardWidget[selected="true"]:hover {
+        background-color: #e3f2fd;
+        border: 2px solid #2196f3;
+    }
+    QLabel#cardCover {
+        color: #6c757d;
+        font-style: italic;
+    }
+    QLabel#cardTitle {
+        color: #2c3e50;
+    }
+    QLabel#cardAuthor {
+        color: #7f8c8d;
+        font-size: 11px;
+    }
+    QLabel#cardStatus {
+        color: white;
+        background-color: #95a5a6;
+        border-radius: 8px;
+        padding: 2px 8px;
+        font-size: 10px;
+        font-weight: bold;
+    }
+    QLabel#cardStatus[status="unread"] {
+        background-color: #e74c3c;
+    }
+    QLabel#cardStatus[status="reading"] {
+        background-color: #f39c12;
+    }
+    QLabel#cardStatus[status="completed"] {
+        background-color: #27ae60;
+    }
+"""
+
+
+def _build_no_cover_pixmap(width: int, height: int, device_pixel_ratio: float = 1.0) -> QPixmap:
+    """
+    Render the "No cover" placeholder once so cards can share it
+    
+    Args:
+        width, height: Logical size of the cover label
+        device_pixel_ratio: Screen scale, so the text stays crisp on HiDPI displays
+    """
+    pixmap = QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    # Painter coordinates are logical once the ratio is set
+    painter = QPainter(pixmap)
+    painter.setPen(QColor('#6c757d'))
+    font = painter.font()
+    font.setItalic(True)
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, "No cover")
+    painter.end()
+    
+    return pixmap
+
+
+def _repolish(widget: QWidget):
+    """Re-apply stylesheet rules after a dynamic property change"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _cover_cache_key(websign: str, width: int, height: int) -> str:
+    """QPixmapCache key for a cover scaled to fit (width, height)"""
+    return f"{websign}@{width}x{height}"
+
+
+class CoverLoader(QRunnable):
+    """
+    Decodes and scales a cover image on a QThreadPool worker
+    
+    Only QImage is used off the GUI thread; the result is delivered
+    through a queued (token, websign, image) signal
+    """
+    
+    def __init__(self, web_controller, websign: str, size: Tuple[int, int], token: int,
+                 ready, is_stale=None):
+        super().__init__()
+        self.web_controller = web_controller
+        self.websign = websign
+        self.size = size
+        self.token = token
+        self.ready = ready
+        self.is_stale = is_stale
+        
+    def run(self):
+        """Load cover in worker thread"""
+        # Skip work that was cancelled while queued
+        if self.is_stale is not None and self.is_stale(self.token, self.websign):
+            return
+            
+        image = self.web_controller.get_cover_qimage(self.websign, size=self.size)
+        if image is None:
+            image = QImage()
+        else:
+            # Convert here so QPixmap.fromImage on the GUI thread is a plain copy
+            image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+            
+        try:
+            self.ready.emit(self.token, self.websign, image)
+        except RuntimeError:
+            # Receiver was deleted while loading
+            pass
+
+
+class CoverPreloader(QObject):
+    """
+    Warms QPixmapCache with covers for rows about to become visible
+    
+    Preloads run below the priority of visible card loads and share the
+    pool's in-flight registry, so a card and a preload never decode the
+    same cover twice. Each preload() call drops queued covers no longer wanted.
+    """
+    
+    cover_ready = pyqtSignal(int, str, QImage)  # epoch, websign, decoded cover (worker thread)
+    
+    def __init__(self, main_window, cover_size: Tuple[int, int],
+                 inflight: Dict[str, list], finish):
+        """
+        Args:
+            main_window: Main window (for its web_controller)
+            cover_size: (width, height) covers are scaled to fit
+            inflight: Shared cache key -> waiting cards map of loads in flight
+            finish: Callback(key, websign, pixmap) that caches a finished cover
+        """
+        super().__init__()
+        self.main_window = main_window
+        self.cover_size = cover_size
+        self._inflight = inflight
+        self._finish = finish
+        self._epoch = 0
+        self._queued: Dict[str, int] = {}  # cache key -> epoch of its queued preload
+        self.cover_ready.connect(self._on_cover_ready)
+        
+    def preload(self, websigns: List[str]):
+        """
+        Queue background loads for covers not already cached or loading
+        
+        Args:
+            websigns: Websigns to preload, in priority order
+        """
+        self._epoch += 1
+        width, height = self.cover_size
+        keys = {websign: _cover_cache_key(websign, width, height) for websign in websigns}
+        
+        # Queued covers that are still wanted keep their place in the queue
+        self._drop_queued(set(keys.values()))
+        
+        pool = QThreadPool.globalInstance()
+        for websign, key in keys.items():
+            if key in self._inflight or QPixmapCache.find(key) is not None:
+                continue
+            self._inflight[key] = []
+            self._queued[key] = self._epoch
+            # Below the default priority, so visible cards are decoded first
+            pool.start(CoverLoader(
+                self.main_window.web_controller, websign, self.cover_size,
+                self._epoch, self.cover_ready, self._is_stale
+            ), -1)
+                
+    def cancel(self):
+        """Drop all queued preloads"""
+        self._drop_queued(set())
+        
+    def _drop_queued(self, keep: Set[str]):
+        """Forget queued preloads outside keep that no card is waiting on"""
+        for key in list(self._queued):
+            if key not in keep and not self._inflight.get(key):
+                del self._queued[key]
+                self._inflight.pop(key, None)
+        
+    def _is_stale(self, epoch: int, websign: str) -> bool:
+        """Check whether a preload was dropped (called from worker threads)"""
+        width, height = self.cover_size
+        return self._queued.get(_cover_cache_key(websign, width, height)) != epoch
+        
+    def _on_cover_ready(self, epoch: int, websign: str, image: QImage):
+        """Cache a preloaded cover on the GUI thread and hand it to waiting cards"""
+        width, height = self.cover_size
+        key = _cover_cache_key(websign, width, height)
+        if self._queued.get(key) == epoch:
+            del self._queued[key]
+            
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
+        self._finish(key, websign, pixmap)
+
+
 class ComicCardWidget(QFrame):
     """
     Comic card widget used in widget pool
@@ -19,6 +234,7 @@ class ComicCardWidget(QFrame):
     
     clicked = pyqtSignal(int)  # Emits row index when clicked
     double_clicked = pyqtSignal(int)  # Emits row index when double-clicked
+    cover_ready = pyqtSignal(int, str, QImage)  # Emits load token, websign and decoded cover (worker thread)
     
     def __init__(self, main_window, parent=None):
         super().__init__(parent)
@@ -26,16 +242,23 @@ class ComicCardWidget(QFrame):
         self.current_row = -1
         self.is_selected = False
         
-        # Setup fixed size
+        # Cover loading: token identifies the latest request so stale results are dropped
+        self._load_token = 0
+        self._cover_cache_key = ""
+        self._current_websign = None  # Websign of the cover currently shown
+        
+        # Text content shown by the labels, so reassigning the same row is cheap
+        self._content_key = None
+        
+        # Owning pool (set by WidgetPool), which batches and shares cover loads
+        self.pool = None
+        self.cover_ready.connect(self._on_cover_ready)
+        
+        # Setup fixed size (setFixedSize also sets minimum/maximum)
         self.setFixedSize(140, 250)
-        self.setMinimumSize(140, 250)
-        self.setMaximumSize(140, 250)
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
         self.setLineWidth(1)
-
-        from PyQt6.QtWidgets import QSizePolicy
-        size_policy = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.setSizePolicy(size_policy)
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         
         # Initialize UI
         self.init_ui()
@@ -46,50 +269,40 @@ class ComicCardWidget(QFrame):
         
     def init_ui(self):
         """Initialize card UI"""
-        layout = QVBoxLayout()
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(6)
+        # Card size is fixed, so children are placed directly instead of
+        # going through a layout on every show/hide (8px margins)
         
         # Cover image
-        self.cover_label = QLabel()
-        self.cover_label.setFixedSize(120, 170)
+        self.cover_label = QLabel(self)
+        self.cover_label.setObjectName("cardCover")
+        self.cover_label.setGeometry(10, 8, 120, 170)
         self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Title
-        self.title_label = QLabel()
+        self.title_label = QLabel(self)
+        self.title_label.setObjectName("cardTitle")
+        self.title_label.setGeometry(8, 184, 124, 18)
         self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setWordWrap(True)
-        self.title_label.setMaximumHeight(40)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                color: #2c3e50;
-                font-size: 12px;
-            }
-        """)
+        
+        # Font is set here rather than in the stylesheet so eliding can use fixed metrics
+        title_font = QFont(self.title_label.font())
+        title_font.setBold(True)
+        title_font.setPixelSize(12)
+        self.title_label.setFont(title_font)
+        self._title_metrics = QFontMetrics(title_font)
         
         # Author
-        self.author_label = QLabel()
+        self.author_label = QLabel(self)
+        self.author_label.setObjectName("cardAuthor")
+        self.author_label.setGeometry(8, 204, 124, 16)
         self.author_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.author_label.setStyleSheet("""
-            QLabel {
-                color: #7f8c8d;
-                font-size: 11px;
-            }
-        """)
         
         # Status
-        self.status_label = QLabel()
-        self.status_label.setFixedHeight(16)
+        self.status_label = QLabel(self)
+        self.status_label.setObjectName("cardStatus")
+        self.status_label.setGeometry(8, 226, 124, 16)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        layout.addWidget(self.cover_label)
-        layout.addWidget(self.title_label)
-        layout.addWidget(self.author_label)
-        layout.addWidget(self.status_label)
-        
-        self.setLayout(layout)
-        
     def update_content(self, row_data: Dict[str, str], row_index: int):
         """
         Update widget content with new data
@@ -100,113 +313,150 @@ class ComicCardWidget(QFrame):
         """
         self.current_row = row_index
         
-        # Title
-        title = row_data.get('title', '')
-        if len(title) > 10:
-            title = title[:8] + '...'
-        self.title_label.setText(title)
-        
-        # Author
-        author = row_data.get('author', '')
-        self.author_label.setText(author)
+        # Labels only change when the comic's text does
+        content_key = (row_data.get('title', ''), row_data.get('author', ''),
+                       row_data.get('read_status', 'unread'))
+        if content_key != self._content_key:
+            self._content_key = content_key
+            title, author, status = content_key
+            
+            # Title (elided to the label width)
+            self.title_label.setText(self._title_metrics.elidedText(
+                title, Qt.TextElideMode.ElideRight, self.title_label.width()
+            ))
+            
+            # Author
+            self.author_label.setText(author)
+            
+            # Status
+            self.status_label.setText(STATUS_TEXT.get(status, status))
+            if self.status_label.property("status") != status:
+                self.status_label.setProperty("status", status)
+                _repolish(self.status_label)
+        
+        # Drop a cover left over from a different comic
+        if str(row_data.get('websign', '')) != self._current_websign:
+            self._current_websign = None
+            self._cover_cache_key = ""  # Ignore a load still in flight for it
+            self.cover_label.clear()
+            
+        # Schedule cover loading (batched by the pool)
+        if self.pool is not None:
+            self.pool.queue_cover(row_index)
+        else:
+            QTimer.singleShot(10, self.load_cover_image)
         
-        # Status
-        status = row_data.get('read_status', 'unread')
-        status_text = {
-            'unread': 'Unread',
-            'reading': 'Reading',
-            'completed': 'Completed'
-        }.get(status, status)
-        
-        status_color = {
-            'unread': '#e74c3c',
-            'reading': '#f39c12',
-            'completed': '#27ae60'
-        }.get(status, '#95a5a6')
-        
-        self.status_label.setText(status_text)
-        self.status_label.setStyleSheet(f"""
-            QLabel {{
-                color: white;
-                background-color: {status_color};
-                border-radius: 8px;
-                padding: 2px 8px;
-                font-size: 10px;
-                font-weight: bold;
-            }}
-        """)
-        
-        # Schedule cover loading
-        QTimer.singleShot(10, self.load_cover_image)
-        
-    def load_cover_image(self):
+    def load_cover_image(self, websign=None):
         """
         Load cover image for current row
         Uses main window's web_controller with safety checks
+        
+        Args:
+            websign: Websign of the current row if the caller already has it
         """
         if self.current_row < 0 or not self.isVisible():
             return
             
-        # Get row data from model
-        model = self.main_window.table.get_model()
-        if not model:
-            return
+        if websign is None:
+            # Get row data from model
+            model = self.main_window.table.get_model()
+            if not model:
+                return
+                
+            row_data = model.get_row_data(self.current_row)
+            if not row_data:
+                return
+                
+            websign = row_data.get('websign', '')
             
-        row_data = model.get_row_data(self.current_row)
-        if not row_data:
+        if not websign:
+            self.show_no_cover()
             return
             
-        websign = row_data.get('websign', '')
-        if not websign:
+        # Reused card already showing this cover
+        websign = str(websign)
+        if websign == self._current_websign:
+            pixmap = self.cover_label.pixmap()
+            if pixmap is not None and not pixmap.isNull():
+                return
+                
+        # Known-missing covers are answered without a worker
+        if self.main_window.web_controller.has_no_cover(websign):
             self.show_no_cover()
             return
             
-        # Load cover using web_controller
-        try:
-            pixmap = self.main_window.web_controller.get_cover_image(
-                str(websign),
-                size=(130, 150)
-            )
+        self._load_token += 1
+        label_size = self.cover_label.size()
+        width, height = label_size.width(), label_size.height()
+        
+        # Scaled covers are shared across widgets through QPixmapCache
+        self._cover_cache_key = _cover_cache_key(websign, width, height)
+        pixmap = QPixmapCache.find(self._cover_cache_key)
+        if pixmap is not None and not pixmap.isNull():
+            self._current_websign = websign
+            self.display_cover(pixmap)
+            return
             
-            if pixmap and not pixmap.isNull():
-                self.display_cover(pixmap)
-            else:
-                self.show_no_cover()
-                
-        except Exception as e:
-            print(f"Error loading cover: {e}")
+        # Decode and scale off the GUI thread (the pool merges duplicate requests)
+        if self.pool is not None:
+            self.pool.request_cover(self, websign, (width, height))
+            return
+            
+        loader = CoverLoader(
+            self.main_window.web_controller, websign, (width, height),
+            self._load_token, self.cover_ready
+        )
+        QThreadPool.globalInstance().start(loader)
+        
+    def _on_cover_ready(self, token: int, websign: str, image: QImage):
+        """
+        Receive decoded cover on the GUI thread
+        Ignores results from superseded requests
+        """
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
+            
+        if self.pool is not None:
+            # Pool fans the result out to every card waiting on this cover
+            size = self.cover_label.size()
+            key = _cover_cache_key(websign, size.width(), size.height())
+            self.pool.finish_cover(key, websign, pixmap)
+        elif token == self._load_token and self.isVisible():
+            if pixmap is not None:
+                QPixmapCache.insert(self._cover_cache_key, pixmap)
+            self.show_loaded_cover(websign, pixmap)
+            
+    def show_loaded_cover(self, websign: str, pixmap: Optional[QPixmap]):
+        """
+        Show the result of a cover load
+        
+        Args:
+            websign: Websign the cover belongs to
+            pixmap: Loaded cover, or None if the comic has no cover
+        """
+        if pixmap is None:
             self.show_no_cover()
+        else:
+            self._current_websign = websign
+            self.display_cover(pixmap)
             
     def display_cover(self, pixmap: QPixmap):
         """
-        Display cover pixmap with proper scaling
+        Display cover pixmap
+        Covers arrive already scaled to the label by the loader or cache
         """
-        label_size = self.cover_label.size()
-        pixmap_size = pixmap.size()
-        
-        # Calculate scale to fit
-        width_ratio = label_size.width() / pixmap_size.width()
-        height_ratio = label_size.height() / pixmap_size.height()
-        scale_factor = min(width_ratio, height_ratio)
-        
-        # Scale
-        new_width = int(pixmap_size.width() * scale_factor)
-        new_height = int(pixmap_size.height() * scale_factor)
-        
-        scaled_pixmap = pixmap.scaled(
-            new_width, new_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        self.cover_label.setPixmap(scaled_pixmap)
+        self.cover_label.setPixmap(pixmap)
         self.cover_label.setText("")
         
     def show_no_cover(self):
         """Show 'No cover' placeholder"""
-        self.cover_label.clear()
-        self.cover_label.setText("No cover")
-        self.cover_label.setStyleSheet("color: #6c757d; font-style: italic;")
+        self._current_websign = None
+        if self.pool is not None:
+            self.cover_label.setPixmap(self.pool.no_cover_pixmap)
+        else:
+            self.cover_label.clear()
+            self.cover_label.setText("No cover")
         
     def set_selected(self, selected: bool):
         """Update selection state"""
@@ -215,26 +465,9 @@ class ComicCardWidget(QFrame):
         
     def update_style(self):
         """Update visual style based on selection state"""
-        if self.is_selected:
-            self.setStyleSheet("""
-                ComicCardWidget {
-                    background-color: #e3f2fd;
-                    border: 2px solid #2196f3;
-                    border-radius: 6px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                ComicCardWidget {
-                    background-color: white;
-                    border: 1px solid #dee2e6;
-                    border-radius: 6px;
-                }
-                ComicCardWidget:hover {
-                    background-color: #f8f9fa;
-                    border: 1px solid #adb5bd;
-                }
-            """)
+        if self.property("selected") != self.is_selected:
+            self.setProperty("selected", self.is_selected)
+            _repolish(self)
             
     def mousePressEvent(self, event):
         """Handle mouse click"""
@@ -248,17 +481,44 @@ class ComicCardWidget(QFrame):
             self.double_clicked.emit(self.current_row)
         super().mouseDoubleClickEvent(event)
         
+    def release(self):
+        """
+        Detach widget from its row when returned to the pool
+        Labels are left as-is; update_content overwrites them on reuse
+        """
+        self.current_row = -1
+        # Drop any in-flight cover load (the pool matches results by cache key)
+        self._load_token += 1
+        self._cover_cache_key = ""
+        
     def clear(self):
         """Clear widget content for reuse"""
-        self.current_row = -1
+        self.release()
         self.is_selected = False
-        self.cover_label.clear()
+        # Cover is kept so reuse for the same comic can skip reloading it
+        self._content_key = None
         self.title_label.clear()
         self.author_label.clear()
         self.status_label.clear()
         self.update_style()
 
 
+class _PoolStats:
+    """Widget pool counters (plain attributes; updated on every acquire/release)"""
+    
+    __slots__ = ('created', 'reused', 'released', 'max_used')
+    
+    def __init__(self):
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.max_used = 0
+        
+    def as_dict(self) -> Dict[str, int]:
+        """Return counters as a dictionary"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 class WidgetPool:
     """
     Manages a pool of reusable comic card widgets
@@ -270,16 +530,32 @@ class WidgetPool:
         
         # Pool management
         self._available_widgets: List[ComicCardWidget] = []
-        self._in_use_widgets: Dict[int, ComicCardWidget] = {}  # row -> widget
-        self._visible_rows: Set[int] = set()
+        self._in_use_widgets: Dict[int, ComicCardWidget] = {}  # row -> widget (keys are the visible rows)
         
         # Performance tracking
-        self._stats = {
-            'created': 0,
-            'reused': 0,
-            'released': 0,
-            'max_used': 0
-        }
+        self._stats = _PoolStats()
+        
+        # Cover loads in flight: cache key -> cards waiting for that cover
+        self._inflight: Dict[str, List[ComicCardWidget]] = {}
+        
+        # Background cover preloading for rows just outside the viewport
+        self._cover_preloader = CoverPreloader(
+            main_window, (120, 170), self._inflight, self.finish_cover
+        )
+        
+        # Placeholder shared by every card without a cover
+        screen = QGuiApplication.primaryScreen()
+        self.no_cover_pixmap = _build_no_cover_pixmap(
+            120, 170, screen.devicePixelRatio() if screen is not None else 1.0
+        )
+        
+        # Cover loads queued by row, started together on one timer
+        self._pending_covers: Set[int] = set()
+        self._pending_preload: Optional[List[str]] = None  # started after the visible covers
+        self._cover_timer = QTimer()
+        self._cover_timer.setSingleShot(True)
+        self._cover_timer.setInterval(16)
+        self._cover_timer.timeout.connect(self._load_pending_covers)
         
         # Pre-create some widgets
         self._precreate_widgets(10)
@@ -287,9 +563,19 @@ class WidgetPool:
     def _precreate_widgets(self, count: int):
         """Pre-create some widgets"""
         for _ in range(min(count, self.max_size)):
-            widget = ComicCardWidget(self.main_window)
-            self._available_widgets.append(widget)
-            self._stats['created'] += 1
+            self._available_widgets.append(self._create_widget())
+            
+    def _create_widget(self) -> ComicCardWidget:
+        """Create a widget and connect its signals once for its lifetime"""
+        widget = ComicCardWidget(self.main_window)
+        widget.pool = self
+        
+        # Widgets emit their current row, so connections survive reuse
+        widget.clicked.connect(self._on_widget_clicked)
+        widget.double_clicked.connect(self._on_widget_double_clicked)
+        
+        self._stats.created += 1
+        return widget
             
     def acquire_widget(self, row: int, row_data: Dict[str, str]) -> Optional[ComicCardWidget]:
         """
@@ -311,45 +597,28 @@ class WidgetPool:
         # Try to get from available pool
         if self._available_widgets:
             widget = self._available_widgets.pop()
-            self._stats['reused'] += 1
+            self._stats.reused += 1
         else:
             # Create new widget if pool not full
             if len(self._in_use_widgets) < self.max_size:
-                widget = ComicCardWidget(self.main_window)
-                self._stats['created'] += 1
+                widget = self._create_widget()
             else:
                 # Pool is full, can't acquire more
                 return None
                 
         # Setup widget
         widget.current_row = row
+        if widget.is_selected:
+            widget.set_selected(False)
         widget.update_content(row_data, row)
         
-        # FIX: Disconnect all previous connections
-        try:
-            widget.clicked.disconnect()
-        except TypeError:
-            # If no connections, just pass
-            pass
-            
-        try:
-            widget.double_clicked.disconnect()
-        except TypeError:
-            # If no connections, just pass
-            pass
-        
-        # Connect signals with lambda that captures current row
-        widget.clicked.connect(lambda r=row: self._on_widget_clicked(r))
-        widget.double_clicked.connect(lambda r=row: self._on_widget_double_clicked(r))
-        
         # Add to in-use map
         self._in_use_widgets[row] = widget
-        self._visible_rows.add(row)
         
         # Update max used
         current_used = len(self._in_use_widgets)
-        if current_used > self._stats['max_used']:
-            self._stats['max_used'] = current_used
+        if current_used > self._stats.max_used:
+            self._stats.max_used = current_used
             
         return widget
         
@@ -363,16 +632,19 @@ class WidgetPool:
         if row in self._in_use_widgets:
             widget = self._in_use_widgets[row]
             
-            # Clear widget
-            widget.clear()
+            # Detach from row; content is overwritten when reused
+            widget.release()
+            
+            # Idle widgets stay parented (and styled) but hidden, so the
+            # viewport skips them when painting until they are reused
+            widget.hide()
             
             # Remove from in-use
             del self._in_use_widgets[row]
-            self._visible_rows.discard(row)
             
             # Return to available pool
             self._available_widgets.append(widget)
-            self._stats['released'] += 1
+            self._stats.released += 1
             
     def update_visible_range(self, start_row: int, end_row: int):
         """
@@ -385,11 +657,9 @@ class WidgetPool:
         visible_set = set(range(start_row, end_row + 1))
         
         # Release widgets for rows no longer visible
-        to_release = self._visible_rows - visible_set
+        to_release = self._in_use_widgets.keys() - visible_set
         for row in to_release:
             self.release_widget(row)
-            
-        self._visible_rows = visible_set
         
     def get_widget_for_row(self, row: int) -> Optional[ComicCardWidget]:
         """
@@ -429,6 +699,87 @@ class WidgetPool:
             widget.deleteLater()
         self._available_widgets.clear()
         
+    def queue_cover(self, row: int):
+        """
+        Queue a cover load for a row
+        
+        Args:
+            row: Row whose widget should load its cover
+        """
+        self._pending_covers.add(row)
+        if not self._cover_timer.isActive():
+            self._cover_timer.start()
+            
+    def _load_pending_covers(self):
+        """Load covers for queued rows that still have a widget, then start preloads"""
+        # Rows released since they were queued are dropped without decoding
+        rows = [row for row in self._pending_covers if row in self._in_use_widgets]
+        self._pending_covers = set()
+        if rows:
+            # Fetch all websigns in one model call
+            model = self.main_window.table.get_model()
+            websigns = model.get_column_values_for_rows('websign', rows)
+            
+            for row, websign in zip(rows, websigns):
+                if websign is not None:
+                    self._in_use_widgets[row].load_cover_image(websign)
+                    
+        # Visible loads are registered in flight first, so preloads skip them
+        if self._pending_preload is not None:
+            self._cover_preloader.preload(self._pending_preload)
+            self._pending_preload = None
+        
+    def request_cover(self, widget: ComicCardWidget, websign: str, size: Tuple[int, int]):
+        """
+        Load a cover for a card, sharing one load between cards that want the same cover
+        
+        Args:
+            widget: Card requesting the cover
+            websign: Websign of the cover
+            size: (width, height) the cover is scaled to fit
+        """
+        key = _cover_cache_key(websign, size[0], size[1])
+        waiting = self._inflight.get(key)
+        if waiting is not None:
+            waiting.append(widget)
+            return
+            
+        self._inflight[key] = [widget]
+        loader = CoverLoader(
+            self.main_window.web_controller, websign, size,
+            widget._load_token, widget.cover_ready
+        )
+        QThreadPool.globalInstance().start(loader)
+        
+    def finish_cover(self, key: str, websign: str, pixmap: Optional[QPixmap]):
+        """
+        Cache a finished cover and show it on every card still waiting for it
+        
+        Args:
+            key: Cover cache key
+            websign: Websign of the cover
+            pixmap: Loaded cover, or None if the comic has no cover
+        """
+        if pixmap is not None:
+            QPixmapCache.insert(key, pixmap)
+            
+        for widget in self._inflight.pop(key, []):
+            # Skip cards released or rebound to another cover since requesting
+            if widget.current_row >= 0 and widget._cover_cache_key == key and widget.isVisible():
+                widget.show_loaded_cover(websign, pixmap)
+        
+    def preload_covers(self, websigns: List[str]):
+        """
+        Preload covers in the background, cancelling any earlier preload
+        Started together with the queued visible covers, behind them
+        
+        Args:
+            websigns: Websigns of rows likely to be shown next
+        """
+        self._pending_preload = websigns
+        if not self._cover_timer.isActive():
+            self._cover_timer.start()
+        
     def get_stats(self) -> Dict[str, Any]:
         """
         Get pool statistics
@@ -437,13 +788,17 @@ class WidgetPool:
             dict: Statistics
         """
         return {
-            **self._stats,
+            **self._stats.as_dict(),
             'available': len(self._available_widgets),
             'in_use': len(self._in_use_widgets),
             'total': len(self._available_widgets) + len(self._in_use_widgets),
-            'visible_rows': len(self._visible_rows)
+            'visible_rows': len(self._in_use_widgets)
         }
 
     def _on_widget_clicked(self, row: int):
         """Handle widget click - forward to main window"""
-        self.main_window.on_widget_clicked(row)
\ No newline at end of file
+        self.main_window.on_widget_clicked(row)
+        
+    def _on_widget_double_clicked(self, row: int):
+        """Handle widget double click - forward to main window"""
+        self.main_window.on_widget_double_clicked(row)